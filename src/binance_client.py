@@ -1,14 +1,72 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import quote
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .utils import RateLimiter, build_http2_client, json_loads
+
+T = TypeVar("T")
+# Bound once; _parse_record runs for every symbol x endpoint
+_UTC = timezone.utc
+_fromts = datetime.fromtimestamp
+
 BASE_URL = "https://fapi.binance.com"
+TOP_ACCOUNT_RATIO_PATH = "/futures/data/topLongShortAccountRatio"
+TOP_POSITION_RATIO_PATH = "/futures/data/topLongShortPositionRatio"
+GLOBAL_RATIO_PATH = "/futures/data/globalLongShortAccountRatio"
+EXCHANGE_INFO_PATH = "/fapi/v1/exchangeInfo"
+TICKER_24H_PATH = "/fapi/v1/ticker/24hr"
+KNOWN_PATHS = (
+    TOP_ACCOUNT_RATIO_PATH,
+    TOP_POSITION_RATIO_PATH,
+    GLOBAL_RATIO_PATH,
+    EXCHANGE_INFO_PATH,
+    TICKER_24H_PATH,
+)
+# Multi-MB bodies (all symbols) are streamed to keep peak memory down
+LARGE_PAYLOAD_PATHS = frozenset((EXCHANGE_INFO_PATH, TICKER_24H_PATH))
+# Default cap on concurrent HTTP requests (BINANCE_MAX_WORKERS); the HTTP pool is sized to cover it
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_POOL_SIZE = 64
+# Upper bound on cached (path, symbol) records before the oldest are evicted
+RECORD_CACHE_MAX = 4096
+# Consecutive fast-path failures before a pinned proxy is dropped
+PREFERRED_MAX_FAILURES = 3
+# Sleep between BINANCE_MAX_ATTEMPTS retries (seconds)
+BACKOFF_BASE = 0.1
+BACKOFF_CAP = 8.0
+# Responses worth retrying on the same base/proxy; other 4xx are fatal for that candidate
+RETRYABLE_STATUSES = frozenset((418, 429, 500, 502, 503, 504))
+# Request-level errors (bad symbol/params, auth, unknown path) that no other base/proxy will fix.
+# 403/451 are left out on purpose: they are geo-blocks that another base or proxy may bypass.
+FATAL_STATUSES = frozenset((400, 401, 404))
+
+
+def _status_of(exc: Exception) -> Optional[int]:
+    return getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Connection errors/timeouts and throttling or 5xx statuses are retryable."""
+    status = _status_of(exc)
+    return status is None or status in RETRYABLE_STATUSES
 
 
 def _build_base_urls(base_url: Optional[str]) -> List[str]:
@@ -20,19 +78,19 @@ def _build_base_urls(base_url: Optional[str]) -> List[str]:
         urls = [single] if single else []
     urls.append(BASE_URL)
     # preserve order, remove duplicates/empty
-    seen = set()
-    result = []
-    for url in urls:
-        if not url or url in seen:
-            continue
-        seen.add(url)
-        result.append(url)
-    return result
+    return [url for url in dict.fromkeys(urls) if url]
 
 
 class BinanceClient:
+    # Shared query template for the 1d long/short ratio endpoints
+    _LATEST_QUERY = "?symbol={}&period=1d&limit=1"
+
     def __init__(self, session: Optional[requests.Session] = None, base_url: Optional[str] = None) -> None:
         self.base_urls = _build_base_urls(base_url)
+        # Full URL per (path, base) so _request does not rebuild strings on every call
+        self._urls: Dict[str, Dict[str, str]] = {
+            path: {base: f"{base}{path}" for base in self.base_urls} for path in KNOWN_PATHS
+        }
         self.session = session or requests.Session()
 
         # Debug flag
@@ -56,7 +114,36 @@ class BinanceClient:
             self.session.proxies.update({"https": proxy, "http": proxy})
             self._dbg(f"Using static proxy from env: {proxy}")
 
+        # Cap on concurrent HTTP requests across all callers' thread pools; the pool is never smaller
+        self.max_workers = max(1, int(os.getenv("BINANCE_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))))
+        self._http_slots = threading.BoundedSemaphore(self.max_workers)
+        # Client-side request rate cap (429/5xx retries take a token too); 0 disables
+        rps = float(os.getenv("BINANCE_RPS", "15"))
+        self._limiter = RateLimiter(rps) if rps > 0 else None
+        # Read once; _request runs for every symbol/endpoint
+        self._max_attempts = max(1, int(os.getenv("BINANCE_MAX_ATTEMPTS", "1")))
         self._configure_retries()
+        self._timeout_s = float(os.getenv("BINANCE_TIMEOUT", "4"))
+
+        # exchangeInfo changes on an hours scale, 24h tickers on seconds; cache both per client
+        self._symbols_ttl = float(os.getenv("BINANCE_SYMBOLS_TTL", "3600"))
+        self._tickers_ttl = float(os.getenv("BINANCE_TICKERS_TTL", "30"))
+        self._symbols_cache: Optional[Tuple[float, List[str]]] = None
+        self._tickers_cache: Optional[Tuple[float, List[Dict]]] = None
+        # Same two payloads shared across CLI invocations via small JSON files
+        self._disk_cache_ttl = float(os.getenv("BINANCE_DISK_CACHE_TTL", "60"))
+        self._cache_dir = Path(
+            os.getenv("BINANCE_CACHE_DIR") or Path.home() / ".cache" / "binance_scrapper"
+        ).expanduser()
+        # Latest ratio records keyed by (path, symbol); _inflight coalesces concurrent identical fetches
+        self._record_ttl = float(os.getenv("BINANCE_RECORD_TTL", "120"))
+        self._record_stale_ttl = float(os.getenv("BINANCE_RECORD_STALE_TTL", "600"))
+        self._record_cache: OrderedDict[Tuple[str, str], Tuple[float, Dict]] = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._cache_lock = threading.Lock()
+        # Stale-record refreshes share one pool (created on first use); _refreshing holds queued keys
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[Tuple[str, str]] = set()
 
         # Optional free proxy rotation (advanced.name public list)
         self.use_free_proxies = os.getenv("BINANCE_USE_FREE_PROXIES", "").lower() in ("1", "true", "yes")
@@ -67,6 +154,7 @@ class BinanceClient:
         self.free_proxies: List[str] = []
         self.preferred_proxy: Optional[str] = None
         self.preferred_base: Optional[str] = None
+        self._preferred_failures = 0
         if self.use_free_proxies:
             try:
                 self.free_proxies = self._load_free_proxies(limit=self.free_proxy_limit, types=self.free_proxy_types)
@@ -75,6 +163,9 @@ class BinanceClient:
                 # Do not fail init on proxy list fetch errors; will continue without them
                 self._dbg(f"Failed to load free proxies: {exc}")
                 self.free_proxies = []
+        # Candidate order for _request; replaced (never mutated in place) when a preference changes
+        self._ordered_bases: List[str] = list(self.base_urls)
+        self._ordered_proxies: List[Optional[str]] = [None, *self.free_proxies]
 
         # Mimic a real browser to reduce 451 blocks on some clouds
         browser_headers = {
@@ -101,71 +192,193 @@ class BinanceClient:
         for key, value in browser_headers.items():
             self.session.headers.setdefault(key, value)
 
+        # Optional HTTP/2 client (httpx[http2]) multiplexing direct requests over one connection
+        self._h2_client = None
+        if os.getenv("BINANCE_USE_HTTP2", "").lower() in ("1", "true", "yes"):
+            self._h2_client = self._build_http2_client()
+        if self._h2_client is not None:
+            # Direct requests bypass the adapter and httpx never retries statuses, so _request does it
+            self._status_attempts = max(self._max_attempts, 1 + self._http_retries)
+
     def _configure_retries(self) -> None:
-        """Configure HTTP retries for transient Binance/proxy hiccups."""
+        """Configure HTTP retries and connection pooling for Binance/proxy requests."""
         retry_total = int(os.getenv("BINANCE_HTTP_RETRIES", "2"))
-        if retry_total <= 0:
-            return
-
-        backoff = float(os.getenv("BINANCE_HTTP_BACKOFF", "0.5"))
-        status_forcelist = (429, 500, 502, 503, 504)
-        retry = Retry(
-            total=retry_total,
-            connect=retry_total,
-            read=retry_total,
-            status=retry_total,
-            backoff_factor=backoff,
-            status_forcelist=status_forcelist,
-            allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
-            respect_retry_after_header=True,
+        pool_size = max(1, int(os.getenv("BINANCE_POOL_SIZE", str(DEFAULT_POOL_SIZE))), self.max_workers)
+
+        # Adapter status retries re-send without a limiter token, so with BINANCE_RPS on
+        # _request retries 429/5xx itself (one token per attempt) and the adapter only retries connect/read
+        adapter_status = retry_total if self._limiter is None else 0
+        self._http_retries = retry_total
+        self._status_attempts = max(self._max_attempts, 1 + retry_total - adapter_status)
+
+        retry: Retry | int = 0
+        if retry_total > 0:
+            backoff = float(os.getenv("BINANCE_HTTP_BACKOFF", "0.5"))
+            status_forcelist = (429, 500, 502, 503, 504)
+            retry = Retry(
+                total=retry_total,
+                connect=retry_total,
+                read=retry_total,
+                status=adapter_status,
+                backoff_factor=backoff,
+                status_forcelist=status_forcelist if adapter_status else None,
+                allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+                respect_retry_after_header=bool(adapter_status),
+                # Hand the last 429/5xx response back so _request sees its status and Retry-After
+                raise_on_status=False,
+            )
+            self._dbg(f"HTTP retries enabled: total={retry_total}, backoff={backoff}, status={adapter_status}")
+
+        # Always mount: the default adapter keeps only 10 pooled connections per host
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
-        self._dbg(f"HTTP retries enabled: total={retry_total}, backoff={backoff}")
+        self._pool_size = pool_size
+        self._dbg(f"HTTP pool size: {pool_size}")
+
+    def _build_http2_client(self):
+        """Return an httpx HTTP/2 client for direct requests, or None if unavailable."""
+        if self.session.proxies:
+            # Static proxies stay on requests.Session; free proxies are per-request anyway
+            self._dbg("HTTP/2 disabled: static proxy configured")
+            return None
+        client = build_http2_client(
+            self.session.headers, self._pool_size, verify=self.session.verify, retries=self._http_retries
+        )
+        if client is None:
+            self._dbg("HTTP/2 unavailable, install httpx[http2]")
+            return None
+        self._dbg("HTTP/2 enabled for direct requests")
+        return client
+
+    def _get_once(self, url: str, params: Optional[Dict], proxy: Optional[str], stream: bool = False) -> Dict:
+        if self._limiter is not None:
+            self._limiter.acquire()
+        # Bound in-flight requests across every thread pool sharing this client
+        with self._http_slots:
+            if proxy is None and self._h2_client is not None:
+                resp = self._h2_client.get(url, params=params, timeout=self._timeout_s)
+                stream = False
+            else:
+                proxies_dict = {"https": proxy, "http": proxy} if proxy else None
+                resp = self.session.get(
+                    url, params=params, timeout=self._timeout_s, proxies=proxies_dict, stream=stream
+                )
+            try:
+                if resp.status_code != 200:
+                    resp.raise_for_status()
+                # Streamed bodies are read in one go instead of requests joining chunks into resp.content
+                body = resp.raw.read(decode_content=True) if stream else resp.content
+            finally:
+                resp.close()
+        try:
+            return json_loads(body)
+        except ValueError as exc_json:
+            self._dbg(f"Invalid JSON from {url} proxy={proxy}: {exc_json}")
+            raise
 
-    def _request(self, path: str, params: Dict) -> Dict:
+    def _request(self, path: str, params: Optional[Dict] = None, query: str = "") -> Dict:
+        """GET ``path`` across bases/proxies; ``query`` is an already-encoded ``?k=v`` suffix."""
         last_error = None
-        proxy_candidates: List[Optional[str]] = [None]
-        if self.free_proxies:
-            proxy_candidates.extend(self.free_proxies)
-
-        max_attempts = max(1, int(os.getenv("BINANCE_MAX_ATTEMPTS", "1")))
-        timeout_s = float(os.getenv("BINANCE_TIMEOUT", "4"))
+        tried: Optional[tuple[str, Optional[str]]] = None
+        urls = self._urls.get(path) or {base: f"{base}{path}" for base in self.base_urls}
+        stream = path in LARGE_PAYLOAD_PATHS and not params and not query
+
+        # Fast path: reuse the base/proxy pair that worked last time before sweeping all candidates
+        if self.preferred_base and (self.preferred_proxy or not self.free_proxies):
+            base, proxy = self.preferred_base, self.preferred_proxy
+            url = urls[base] + query
+            try:
+                data = self._get_with_retries(url, params, proxy, stream)
+                self._preferred_failures = 0
+                return data
+            except Exception as exc:  # pylint: disable=broad-except
+                last_error = RuntimeError(f"{url} preferred proxy={proxy} failed: {exc}")
+                if _status_of(exc) in FATAL_STATUSES:
+                    raise last_error from exc
+                tried = (base, proxy)
+                self._preferred_failures += 1
+                if proxy and self._preferred_failures >= PREFERRED_MAX_FAILURES:
+                    self._dbg(f"Dropping preferred proxy after {self._preferred_failures} failures: {proxy}")
+                    self.preferred_proxy = None
+                    self._preferred_failures = 0
+                    self._ordered_proxies = [p for p in self._ordered_proxies if p != proxy] + [proxy]
+
+        for base in self._ordered_bases:
+            url = urls[base] + query
+            for proxy in self._ordered_proxies:
+                if (base, proxy) == tried:
+                    continue
+                try:
+                    data = self._get_with_retries(url, params, proxy, stream)
+                except Exception as exc:  # pylint: disable=broad-except
+                    last_error = RuntimeError(f"{url} proxy={proxy} failed: {exc}")
+                    if _status_of(exc) in FATAL_STATUSES:
+                        raise last_error from exc
+                    # Other 4xx (403/451) or retries used up: move on to the next proxy/base
+                    continue
+                self._dbg(f"Success {url} via proxy={proxy}")
+                self._remember_success(base, proxy)
+                return data
+        raise last_error  # type: ignore[misc]
 
-        bases = list(self.base_urls)
-        if self.preferred_base and self.preferred_base in bases:
-            bases = [self.preferred_base] + [b for b in bases if b != self.preferred_base]
+    def _get_with_retries(self, url: str, params: Optional[Dict], proxy: Optional[str], stream: bool) -> Dict:
+        """GET one base/proxy candidate, retrying retryable failures with backoff.
 
-        for base in bases:
-            url = f"{base}{path}"
-            effective_proxies = proxy_candidates
-            if self.preferred_proxy:
-                effective_proxies = [self.preferred_proxy] + [p for p in proxy_candidates if p != self.preferred_proxy]
+        Network errors get BINANCE_MAX_ATTEMPTS tries; 429/5xx may also get the status retries
+        taken away from the adapter, so every re-send goes through the rate limiter.
+        """
+        delay = BACKOFF_BASE
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._dbg(f"GET {url} attempt {attempt} proxy={proxy}")
+                return self._get_once(url, params, proxy, stream)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._dbg(f"Error {url} attempt {attempt} proxy={proxy}: {exc}")
+                limit = self._max_attempts if _status_of(exc) is None else self._status_attempts
+                if attempt >= limit or not _is_retryable(exc):
+                    raise
+                delay = self._backoff_delay(delay, exc)
+                if delay is None:
+                    # Told to wait longer than BACKOFF_CAP (e.g. a 418 ban); give up on this candidate
+                    raise
+                time.sleep(delay)
+
+    def _remember_success(self, base: str, proxy: Optional[str]) -> None:
+        """Pin a working base/proxy and move it to the front of the candidate order."""
+        if self._ordered_bases[0] != base:
+            self._ordered_bases = [base] + [b for b in self._ordered_bases if b != base]
+        if proxy and self._ordered_proxies[0] != proxy:
+            self._ordered_proxies = [proxy] + [p for p in self._ordered_proxies if p != proxy]
+        if proxy:
+            self.preferred_proxy = proxy
+        self.preferred_base = base
+        self._preferred_failures = 0
 
-            for proxy in effective_proxies:
-                proxies_dict = {"https": proxy, "http": proxy} if proxy else None
-                for attempt in range(max_attempts):
-                    try:
-                        self._dbg(f"GET {url} attempt {attempt + 1} proxy={proxy}")
-                        resp = self.session.get(url, params=params, timeout=timeout_s, proxies=proxies_dict)
-                        if resp.status_code >= 400:
-                            resp.raise_for_status()
-                        try:
-                            data = resp.json()
-                        except ValueError as exc_json:
-                            self._dbg(f"Invalid JSON from {url} proxy={proxy}: {exc_json}")
-                            raise
-                        self._dbg(f"Success {url} via proxy={proxy}")
-                        if proxy:
-                            self.preferred_proxy = proxy
-                        self.preferred_base = base
-                        return data
-                    except Exception as exc:  # pylint: disable=broad-except
-                        last_error = RuntimeError(f"{url} attempt {attempt + 1} proxy={proxy} failed: {exc}")
-                        self._dbg(f"Error {url} attempt {attempt + 1} proxy={proxy}: {exc}")
-                        # retry/backoff handled by HTTPAdapter; loop moves to next proxy/base
-        raise last_error  # type: ignore[misc]
+    @staticmethod
+    def _backoff_delay(prev_delay: float, exc: Exception) -> Optional[float]:
+        """Decorrelated-jitter backoff; a Retry-After header on the failed response wins.
+
+        Returns None when Retry-After exceeds BACKOFF_CAP: retrying that candidate early would
+        only extend a ban, so the caller gives up on it instead.
+        """
+        response = getattr(exc, "response", None)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                pass
+            else:
+                return wait if wait <= BACKOFF_CAP else None
+        return random.uniform(BACKOFF_BASE, min(BACKOFF_CAP, prev_delay * 3))
 
     def _load_free_proxies(self, limit: int = 20, types: List[str] | None = None) -> List[str]:
         types = types or ["https"]
@@ -176,125 +389,289 @@ class BinanceClient:
         custom_proxy_url = os.getenv("BINANCE_FREE_PROXY_URL")
         if custom_proxy_url:
             sources["https"] = custom_proxy_url
+        urls = list(dict.fromkeys(sources[t] for t in types if t in sources))
+        if not urls:
+            return []
+        # Download the per-protocol lists concurrently; order of `types` is kept for priority
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            fetched = list(pool.map(self._fetch_proxy_list, urls))
+
         seen = set()
         raw_proxies: List[str] = []
-        for t in types:
-            url = sources.get(t)
-            if not url:
-                continue
-            try:
-                self._dbg(f"Fetch proxy list: {url}")
-                resp = self.session.get(url, timeout=10)
-                resp.raise_for_status()
-            except Exception as exc:
-                self._dbg(f"Proxy list fetch failed {url}: {exc}")
-                continue
-            # Each line is host:port
-            candidates = [line.strip() for line in resp.text.splitlines() if ":" in line]
-            self._dbg(f"Found {len(candidates)} raw proxies for type={t}")
+        for candidates in fetched:
             for p in candidates:
                 if p in seen:
                     continue
                 seen.add(p)
                 proxy_url = f"http://{p}"
                 raw_proxies.append(proxy_url)
+            if len(raw_proxies) >= limit:
+                break
         proxies = raw_proxies[:limit]
         if proxies:
             self._dbg(f"Collected {len(proxies)} free proxies (no prevalidation, lazy fallback in _request)")
         return proxies
 
+    def _fetch_proxy_list(self, url: str) -> List[str]:
+        try:
+            self._dbg(f"Fetch proxy list: {url}")
+            resp = self.session.get(url, timeout=10)
+            resp.raise_for_status()
+        except Exception as exc:
+            self._dbg(f"Proxy list fetch failed {url}: {exc}")
+            return []
+        # Each line is host:port
+        candidates = [line.strip() for line in resp.text.splitlines() if ":" in line]
+        self._dbg(f"Found {len(candidates)} raw proxies in {url}")
+        return candidates
+
     def _dbg(self, msg: str) -> None:
         if self.debug:
             print(f"[DEBUG][BinanceClient] {msg}")
 
     def _get_latest(self, path: str, symbol: str) -> Dict:
-        params = {"symbol": symbol, "period": "1d", "limit": 1}
-        data = self._request(path, params)
+        """Return the latest record for (path, symbol) with stale-while-revalidate caching.
+
+        Records younger than BINANCE_RECORD_TTL are returned as is; records younger than
+        BINANCE_RECORD_STALE_TTL are returned immediately while a background worker refreshes them.
+        """
+        key = (path, symbol)
+        with self._cache_lock:
+            entry = self._record_cache.get(key)
+            if entry:
+                self._record_cache.move_to_end(key)
+        if entry:
+            age = time.monotonic() - entry[0]
+            if age < self._record_ttl:
+                return entry[1]
+            if age < self._record_stale_ttl:
+                self._schedule_refresh(key)
+                return entry[1]
+        return self._single_flight(key, lambda: self._fetch_latest(path, symbol))
+
+    def close(self) -> None:
+        """Cancel queued background refreshes so interpreter exit does not wait for them."""
+        with self._cache_lock:
+            pool, self._refresh_pool = self._refresh_pool, None
+            self._refreshing.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_refresh(self, key: Tuple[str, str]) -> None:
+        """Queue one background refresh per key on a pool capped at BINANCE_MAX_WORKERS threads."""
+        with self._cache_lock:
+            if key in self._refreshing or key in self._inflight:
+                return
+            self._refreshing.add(key)
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="binance-refresh"
+                )
+            pool = self._refresh_pool
+        pool.submit(self._refresh_latest, *key)
+
+    def _refresh_latest(self, path: str, symbol: str) -> None:
+        try:
+            self._single_flight((path, symbol), lambda: self._fetch_latest(path, symbol))
+        except Exception as exc:  # pylint: disable=broad-except
+            # Keep serving the stale record; the next stale hit retries
+            self._dbg(f"Background refresh failed {path} {symbol}: {exc}")
+        finally:
+            with self._cache_lock:
+                self._refreshing.discard((path, symbol))
+
+    def _fetch_latest(self, path: str, symbol: str) -> Dict:
+        # Pre-encoded query skips requests' per-call params encoding
+        data = self._request(path, query=self._LATEST_QUERY.format(quote(symbol, safe="")))
         if not data:
             raise ValueError(f"No data returned for {symbol} at {path}")
         record = data[-1]
+        if self._record_ttl > 0:
+            with self._cache_lock:
+                self._record_cache[(path, symbol)] = (time.monotonic(), record)
+                self._record_cache.move_to_end((path, symbol))
+                while len(self._record_cache) > RECORD_CACHE_MAX:
+                    self._record_cache.popitem(last=False)
         return record
 
+    def _single_flight(self, key: Tuple[str, str], fetch: Callable[[], T]) -> T:
+        """Run ``fetch`` once per key at a time; concurrent callers wait for the same result.
+
+        Keys are ``(path, symbol)``; whole-exchange endpoints use an empty symbol.
+        """
+        with self._cache_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        try:
+            result = fetch()
+        except Exception as exc:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+        with self._cache_lock:
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        return result
+
     @staticmethod
     def _parse_record(record: Dict) -> Dict:
         try:
             ratio = float(record["longShortRatio"])
+            timestamp_ms = record.get("timestamp")
         except (KeyError, TypeError, ValueError) as exc:
             raise ValueError(f"Invalid record: {record}") from exc
 
-        long_pct = (ratio / (1 + ratio)) * 100
-        short_pct = 100 - long_pct
-
-        timestamp_ms = record.get("timestamp")
-        ts = (
-            datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            if isinstance(timestamp_ms, (int, float))
-            else None
-        )
+        long_pct = ratio / (1 + ratio) * 100
+        ts = _fromts(timestamp_ms * 1e-3, _UTC) if type(timestamp_ms) in (int, float) else None
 
         return {
             "ratio": ratio,
             "long_pct": long_pct,
-            "short_pct": short_pct,
+            "short_pct": 100 - long_pct,
             "timestamp": ts,
         }
 
     def top_trader_accounts(self, symbol: str) -> Dict:
-        record = self._get_latest("/futures/data/topLongShortAccountRatio", symbol)
+        record = self._get_latest(TOP_ACCOUNT_RATIO_PATH, symbol)
         return self._parse_record(record)
 
     def top_trader_positions(self, symbol: str) -> Dict:
-        record = self._get_latest("/futures/data/topLongShortPositionRatio", symbol)
+        record = self._get_latest(TOP_POSITION_RATIO_PATH, symbol)
         return self._parse_record(record)
 
     def global_long_short(self, symbol: str) -> Dict:
-        record = self._get_latest("/futures/data/globalLongShortAccountRatio", symbol)
+        record = self._get_latest(GLOBAL_RATIO_PATH, symbol)
         return self._parse_record(record)
 
+    def fetch_all_ratios(self, symbol: str) -> Dict[str, Dict]:
+        """Fetch the three 1d long/short ratios for ``symbol`` in parallel."""
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {
+                "accounts": pool.submit(self.top_trader_accounts, symbol),
+                "positions": pool.submit(self.top_trader_positions, symbol),
+                "global": pool.submit(self.global_long_short, symbol),
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     def list_usdt_perpetual_symbols(self) -> List[str]:
-        """Return tradable USDT-margined perpetual symbols."""
-        data = self._request("/fapi/v1/exchangeInfo", {})
+        """Return tradable USDT-margined perpetual symbols (cached for BINANCE_SYMBOLS_TTL)."""
+        cached = self._symbols_cache
+        if cached and time.monotonic() - cached[0] < self._symbols_ttl:
+            return list(cached[1])
+        return list(self._single_flight((EXCHANGE_INFO_PATH, ""), self._fetch_usdt_perpetual_symbols))
+
+    def _fetch_usdt_perpetual_symbols(self) -> List[str]:
+        cached = self._disk_cache_load(EXCHANGE_INFO_PATH, self._symbols_ttl)
+        if cached and isinstance(cached[1], list):
+            # Keep the file's age so the memory TTL does not restart from zero
+            self._symbols_cache = (time.monotonic() - (time.time() - cached[0]), cached[1])
+            return cached[1]
+        try:
+            data = self._request(EXCHANGE_INFO_PATH)
+        except Exception:
+            self._symbols_cache = None
+            raise
         symbols = []
-        for item in data.get("symbols", []):
-            try:
-                if item.get("contractType") != "PERPETUAL":
-                    continue
-                if item.get("quoteAsset") != "USDT":
-                    continue
-                if item.get("status") != "TRADING":
-                    continue
-                symbol = item.get("symbol")
-                if symbol:
-                    symbols.append(str(symbol))
-            except Exception:
-                continue
+        for item in data.get("symbols", ()):
+            if (
+                item.get("contractType") == "PERPETUAL"
+                and item.get("quoteAsset") == "USDT"
+                and item.get("status") == "TRADING"
+                and item.get("symbol")
+            ):
+                symbols.append(str(item["symbol"]))
+        self._symbols_cache = (time.monotonic(), symbols)
+        self._disk_cache_store(EXCHANGE_INFO_PATH, symbols, self._symbols_ttl)
         return symbols
 
     def all_24h_tickers(self) -> List[Dict]:
-        """Return 24h ticker stats for all symbols."""
-        data = self._request("/fapi/v1/ticker/24hr", {})
-        return data if isinstance(data, list) else []
+        """Return 24h ticker stats for all symbols (cached for BINANCE_TICKERS_TTL)."""
+        cached = self._tickers_cache
+        if cached and time.monotonic() - cached[0] < self._tickers_ttl:
+            return list(cached[1])
+        return list(self._single_flight((TICKER_24H_PATH, ""), self._fetch_24h_tickers))
+
+    def _fetch_24h_tickers(self) -> List[Dict]:
+        cached = self._disk_cache_load(TICKER_24H_PATH, self._tickers_ttl)
+        if cached and isinstance(cached[1], list):
+            self._tickers_cache = (time.monotonic() - (time.time() - cached[0]), cached[1])
+            return cached[1]
+        try:
+            data = self._request(TICKER_24H_PATH)
+        except Exception:
+            self._tickers_cache = None
+            raise
+        tickers = data if isinstance(data, list) else []
+        self._tickers_cache = (time.monotonic(), tickers)
+        self._disk_cache_store(TICKER_24H_PATH, tickers, self._tickers_ttl)
+        return tickers
+
+    def _disk_cache_file(self, path: str) -> Path:
+        # Keyed on the candidate URLs, so clients pointed at other hosts (e.g. testnet) never share a file
+        key = " ".join(f"{base}{path}" for base in self.base_urls)
+        return self._cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _disk_cache_load(self, path: str, memory_ttl: float) -> Optional[Tuple[float, object]]:
+        """Return ``(ts, body)`` cached on disk for ``path`` if younger than BINANCE_DISK_CACHE_TTL.
+
+        The age is also capped at the matching in-memory TTL, so setting that TTL to 0 bypasses the disk too.
+        """
+        max_age = min(self._disk_cache_ttl, memory_ttl)
+        if max_age <= 0:
+            return None
+        cache_file = self._disk_cache_file(path)
+        try:
+            payload = json_loads(cache_file.read_bytes())
+            ts = float(payload["ts"])
+            if time.time() - ts < max_age:
+                self._dbg(f"Disk cache hit {path}")
+                return ts, payload["body"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            self._dbg(f"Dropping unreadable disk cache {cache_file}: {exc}")
+            # Best effort too: a read-only dir or a directory at this path must not fail the scan
+            with suppress(OSError):
+                cache_file.unlink(missing_ok=True)
+        return None
+
+    def _disk_cache_store(self, path: str, body: object, memory_ttl: float) -> None:
+        if min(self._disk_cache_ttl, memory_ttl) <= 0:
+            return
+        cache_file = self._disk_cache_file(path)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps({"ts": time.time(), "body": body}), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        except OSError as exc:
+            # Cache is best effort (read-only home, full disk, ...)
+            self._dbg(f"Disk cache write failed {cache_file}: {exc}")
 
     def list_top_volume_usdt_perpetual(self, limit: int = 120) -> List[str]:
         """Return top-N USDT perpetual symbols by quote volume (24h)."""
-        allowed = set(self.list_usdt_perpetual_symbols())
-        tickers = self.all_24h_tickers()
-        scored: List[tuple[str, float]] = []
-        for t in tickers:
-            try:
-                symbol = str(t.get("symbol", ""))
-                if symbol not in allowed:
-                    continue
-                vol = float(t.get("quoteVolume", 0.0))
-                scored.append((symbol, vol))
-            except Exception:
-                continue
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [s for s, _ in scored[:limit]]
+        # exchangeInfo and ticker/24hr are independent; fetch them in parallel
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            symbols_future = pool.submit(self.list_usdt_perpetual_symbols)
+            tickers_future = pool.submit(self.all_24h_tickers)
+            allowed = frozenset(symbols_future.result())
+            tickers = tickers_future.result()
+        # Stream (symbol, volume) pairs straight into the top-k heap; no intermediate list
+        scored = ((t["symbol"], float(t.get("quoteVolume", 0.0))) for t in tickers if t.get("symbol") in allowed)
+        return [s for s, _ in heapq.nlargest(limit, scored, key=itemgetter(1))]
 
     def ticker_24h(self, symbol: str) -> Dict:
         """Return 24h ticker for a symbol (price + change)."""
-        data = self._request("/fapi/v1/ticker/24hr", {"symbol": symbol})
+        data = self._single_flight(
+            (TICKER_24H_PATH, symbol),
+            lambda: self._request(TICKER_24H_PATH, query=f"?symbol={quote(symbol, safe='')}"),
+        )
         try:
             last_price = float(data["lastPrice"])
             change_pct = float(data["priceChangePercent"])
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
 from pathlib import Path
 from typing import List, TypedDict
 
+from .utils import json_loads
+
 
 class Settings(TypedDict):
     pairs: List[str]
@@ -15,26 +17,34 @@ class Settings(TypedDict):
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "settings.json"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_json_settings(path: Path) -> dict:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
+
+
+def _normalize_pairs(pairs: list) -> List[str]:
+    return [p.strip().upper() for p in pairs if isinstance(p, str) and p.strip()]
 
 
 def _pairs_from_env() -> List[str] | None:
     raw = os.getenv("PAIRS")
     if not raw:
         return None
-    pairs = [item.strip().upper() for item in raw.split(",") if item.strip()]
-    return pairs or None
+    return _normalize_pairs(raw.split(",")) or None
 
 
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    """Resolve settings once per process; call ``load_settings.cache_clear()`` after changing env/config."""
     file_settings = _load_json_settings(CONFIG_PATH)
 
-    pairs = _pairs_from_env() or file_settings.get("pairs")
-    if not pairs or not isinstance(pairs, list):
+    pairs = _pairs_from_env()
+    if pairs is None:
+        file_pairs = file_settings.get("pairs")
+        pairs = _normalize_pairs(file_pairs) if isinstance(file_pairs, list) else []
+    if not pairs:
         raise ValueError("Pairs are not configured. Set PAIRS env or config/settings.json")
 
     telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID") or file_settings.get("telegram_chat_id")
@@ -46,7 +56,7 @@ def load_settings() -> Settings:
         raise ValueError("Telegram bot token is missing. Set TELEGRAM_BOT_TOKEN environment variable")
 
     return {
-        "pairs": [p.upper() for p in pairs],
+        "pairs": pairs,
         "telegram_chat_id": str(telegram_chat_id),
         "telegram_bot_token": telegram_bot_token,
     }
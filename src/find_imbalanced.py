@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 from datetime import datetime, timezone
+from itertools import takewhile
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 
 from .binance_client import BinanceClient
@@ -16,31 +19,27 @@ def find_top_imbalances(
     limit: int = 10,
     candidates: int = 120,
     max_quote_volume: Optional[float] = None,
+    workers: int = 16,
 ) -> Tuple[List[dict], List[dict], List[str]]:
     # Pre-filter by highest quoteVolume to avoid thousands of requests
-    allowed = set(client.list_usdt_perpetual_symbols())
+    allowed = frozenset(client.list_usdt_perpetual_symbols())
     tickers = client.all_24h_tickers()
-    ticker_map: Dict[str, Dict[str, object]] = {}
-    scored: List[tuple[str, float]] = []
+    scored: List[tuple[str, float, dict]] = []
     for t in tickers:
-        try:
-            symbol = str(t.get("symbol", ""))
-            if symbol not in allowed:
-                continue
-            vol = float(t.get("quoteVolume", 0.0))
-            if max_quote_volume is not None and vol > max_quote_volume:
-                continue
-            scored.append((symbol, vol))
-            # Cache ticker to avoid an extra request later
-            ticker_map[symbol] = {
-                "last_price": float(t.get("lastPrice", 0.0)),
-                "change_pct": float(t.get("priceChangePercent", 0.0)),
-            }
-        except Exception:
+        symbol = t["symbol"]
+        if symbol not in allowed:
             continue
-
-    scored.sort(key=lambda x: x[1], reverse=True)
-    symbols = [s for s, _ in scored[:candidates]]
+        vol = float(t["quoteVolume"])
+        if max_quote_volume is not None and vol > max_quote_volume:
+            continue
+        scored.append((symbol, vol, t))
+
+    top = heapq.nlargest(candidates, scored, key=itemgetter(1))
+    symbols = [s for s, _, _ in top]
+    # Cache tickers of the selected symbols only, to avoid an extra request later
+    ticker_map: Dict[str, Dict[str, object]] = {
+        s: {"last_price": float(t["lastPrice"]), "change_pct": float(t["priceChangePercent"])} for s, _, t in top
+    }
     volume_note = f" (max_quote_volume={max_quote_volume})" if max_quote_volume is not None else ""
     print(f"[info] Candidates by volume: {len(symbols)}{volume_note}")
 
@@ -48,9 +47,15 @@ def find_top_imbalances(
         status = "error" if is_error else "ok"
         print(f"[progress] {idx}/{total} {symbol} {status}")
 
-    metrics, errors = collect_metrics(client, symbols, progress=_progress, ticker_map=ticker_map)
-    sorted_pairs = sorted(metrics, key=_pair_max_imbalance, reverse=True)
-    imbalanced = [m for m in sorted_pairs if _pair_max_imbalance(m) > HIGHLIGHT_THRESHOLD]
+    metrics, errors = collect_metrics(
+        client, symbols, progress=_progress, ticker_map=ticker_map, max_workers=workers
+    )
+    # Score each pair once; sorting, filtering and the Telegram report reuse the cached "_max_imb"
+    for item in metrics:
+        _pair_max_imbalance(item)
+    sorted_pairs = sorted(metrics, key=itemgetter("_max_imb"), reverse=True)
+    # Ranked by score, so the imbalanced set is the leading run; stop at the first pair under the threshold
+    imbalanced = list(takewhile(lambda m: m["_max_imb"] > HIGHLIGHT_THRESHOLD, sorted_pairs))
     return sorted_pairs[:limit], imbalanced, errors
 
 
@@ -66,6 +71,11 @@ def format_console_report(pairs: List[dict]) -> str:
     return "\n".join(lines)
 
 
+def _with_part_label(msg: str, idx: int, total: int) -> str:
+    header, sep, rest = msg.partition("\n")
+    return f"{header} (part {idx}/{total}){sep}{rest}"
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Find symbols with biggest long/short imbalance")
     parser.add_argument("--limit", type=int, default=10, help="How many top symbols to print")
@@ -81,15 +91,25 @@ def main() -> None:
         default=None,
         help="Filter symbols with 24h quoteVolume <= this value (e.g. 10000000 for <$10m)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="How many symbols to query in parallel (HTTP concurrency is capped by BINANCE_MAX_WORKERS)",
+    )
     args = parser.parse_args()
 
     client = BinanceClient()
-    top_pairs, imbalanced_pairs, errors = find_top_imbalances(
-        client,
-        limit=args.limit,
-        candidates=args.candidates,
-        max_quote_volume=args.max_quote_volume,
-    )
+    try:
+        top_pairs, imbalanced_pairs, errors = find_top_imbalances(
+            client,
+            limit=args.limit,
+            candidates=args.candidates,
+            max_quote_volume=args.max_quote_volume,
+            workers=args.workers,
+        )
+    finally:
+        client.close()
 
     if errors:
         print("Partial errors:", *errors, sep="\n- ")
@@ -112,16 +132,14 @@ def main() -> None:
         total_parts = len(batches)
         print(f"[info] Telegram payload symbols: {len(imbalanced_pairs)} (> {HIGHLIGHT_THRESHOLD:.1f}x), parts={total_parts}")
 
+        # Compose every part up front, then send them in order
+        messages = [build_message(run_dt, batch, errors=None) for batch in batches]
+        if total_parts > 1:
+            messages = [_with_part_label(msg, idx, total_parts) for idx, msg in enumerate(messages, start=1)]
+
         telegram = TelegramClient(settings["telegram_bot_token"])
-        for idx, batch in enumerate(batches, start=1):
-            msg = build_message(run_dt, batch, errors=None)
-            if total_parts > 1:
-                lines = msg.split("\n")
-                if lines:
-                    lines[0] = f"{lines[0]} (part {idx}/{total_parts})"
-                msg = "\n".join(lines)
-            telegram.send_message(settings["telegram_chat_id"], msg)
-            print(f"[info] Telegram part {idx}/{total_parts} sent ({len(batch)} symbols)")
+        telegram.send_messages(settings["telegram_chat_id"], messages)
+        print(f"[info] Telegram parts sent: {total_parts} ({len(imbalanced_pairs)} symbols)")
         return
 
     telegram = TelegramClient(settings["telegram_bot_token"])
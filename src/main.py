@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -18,41 +19,50 @@ def collect_metrics(
     symbols: List[str],
     progress: ProgressCb = None,
     ticker_map: Optional[Dict[str, Dict[str, object]]] = None,
+    max_workers: int = 16,
 ) -> Tuple[List[Dict[str, object]], List[str]]:
-    results: List[Dict[str, object]] = []
-    errors: List[str] = []
+    """Fetch metrics for all symbols concurrently; results and errors keep input order."""
     total = len(symbols)
-    for idx, symbol in enumerate(symbols, start=1):
-        try:
-            accounts = client.top_trader_accounts(symbol)
-            positions = client.top_trader_positions(symbol)
-            global_ratio = client.global_long_short(symbol)
-            ticker = ticker_map.get(symbol) if ticker_map else None
-            if not ticker:
-                ticker = client.ticker_24h(symbol)
-            results.append(
-                {
-                    "symbol": symbol,
-                    "accounts": accounts,
-                    "positions": positions,
-                    "global": global_ratio,
-                    "ticker": ticker,
-                }
-            )
-            if progress:
-                progress(idx, total, symbol, False)
-        except Exception as exc:  # pylint: disable=broad-except
-            errors.append(f"{symbol}: {exc}")
-            if progress:
-                progress(idx, total, symbol, True)
-    return results, errors
+    results: List[Optional[Dict[str, object]]] = [None] * total
+    errors: List[Optional[str]] = [None] * total
+
+    def _collect(symbol: str) -> Dict[str, object]:
+        ratios = client.fetch_all_ratios(symbol)
+        ticker = ticker_map.get(symbol) if ticker_map else None
+        if not ticker:
+            ticker = client.ticker_24h(symbol)
+        return {
+            "symbol": symbol,
+            "accounts": ratios["accounts"],
+            "positions": ratios["positions"],
+            "global": ratios["global"],
+            "ticker": ticker,
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as pool:
+        futures = {pool.submit(_collect, symbol): (pos, symbol) for pos, symbol in enumerate(symbols)}
+        # as_completed yields in this thread, so progress callbacks never run concurrently
+        for idx, future in enumerate(as_completed(futures), start=1):
+            pos, symbol = futures[future]
+            try:
+                results[pos] = future.result()
+                if progress:
+                    progress(idx, total, symbol, False)
+            except Exception as exc:  # pylint: disable=broad-except
+                errors[pos] = f"{symbol}: {exc}"
+                if progress:
+                    progress(idx, total, symbol, True)
+    return [r for r in results if r is not None], [e for e in errors if e is not None]
 
 
 def main() -> None:
     try:
         settings = load_settings()
         binance = BinanceClient()
-        metrics, errors = collect_metrics(binance, settings["pairs"])
+        try:
+            metrics, errors = collect_metrics(binance, settings["pairs"])
+        finally:
+            binance.close()
         if not metrics:
             raise RuntimeError(f"All symbol requests failed: {errors}")
         if errors:
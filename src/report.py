@@ -1,20 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 Metric = Dict[str, object]
 HIGHLIGHT_THRESHOLD = 2.3
 
 
-def _fmt_pct(value: float) -> str:
-    return f"{value:.2f}%"
-
-
-def _fmt_ratio(value: float) -> str:
-    return f"{value:.2f}x"
-
-
 def _fmt_price(value: float) -> str:
     if value >= 100:
         return f"{value:.2f}"
@@ -38,13 +30,10 @@ def _imbalance_value(metric: Metric | None) -> float:
     """Return symmetric imbalance factor (>=1) or 0 if unavailable."""
     if not metric:
         return 0.0
-    try:
-        ratio = float(metric["ratio"])
-    except (KeyError, TypeError, ValueError):
-        return 0.0
-    if ratio <= 0:
+    ratio = metric.get("ratio")
+    if not isinstance(ratio, (int, float)) or ratio <= 0:
         return 0.0
-    return ratio if ratio >= 1 else 1 / ratio
+    return ratio if ratio >= 1 else 1.0 / ratio
 
 
 def _format_metric(label: str, metric: Metric | None) -> str:
@@ -53,38 +42,44 @@ def _format_metric(label: str, metric: Metric | None) -> str:
     imbalance = _imbalance_value(metric)
     highlight = imbalance > HIGHLIGHT_THRESHOLD
     content = (
-        f"<b>{label}</b>: long {_fmt_pct(metric['long_pct'])} / "
-        f"short {_fmt_pct(metric['short_pct'])} "
-        f"({_fmt_ratio(metric['ratio'])})"
+        f"<b>{label}</b>: long {metric['long_pct']:.2f}% / "
+        f"short {metric['short_pct']:.2f}% "
+        f"({metric['ratio']:.2f}x)"
     )
     return f"⚠️ <b>{content}</b>" if highlight else content
 
 
 def _pair_max_imbalance(item: Dict[str, object]) -> float:
-    metrics = [item.get("accounts"), item.get("positions"), item.get("global")]
-    return max((_imbalance_value(m) for m in metrics), default=0.0)
-
-
-def build_message(run_dt: datetime, pairs: List[Dict[str, object]], errors: List[str] | None = None) -> str:
-    lines: List[str] = []
+    """Max imbalance across the three metrics, memoized on the item as ``_max_imb``."""
+    cached = item.get("_max_imb")
+    if cached is None:
+        cached = item["_max_imb"] = max(
+            _imbalance_value(item.get("accounts")),
+            _imbalance_value(item.get("positions")),
+            _imbalance_value(item.get("global")),
+        )
+    return cached  # type: ignore[return-value]
+
+
+def _iter_lines(run_dt: datetime, pairs: List[Dict[str, object]], errors: List[str] | None) -> Iterator[str]:
     utc_time = run_dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    lines.append("⭐️ <b>Binance Futures Long/Short (1d)</b>")
-    lines.append(f"<i>Run: {utc_time}</i>")
-
-    sorted_pairs = sorted(pairs, key=_pair_max_imbalance, reverse=True)
-    for item in sorted_pairs:
-        lines.append("")
-        symbol = str(item["symbol"])
-        lines.append(f"<u><b>{symbol}</b></u>")
-        lines.append(f"• {_format_ticker(item.get('ticker'))}")
-        lines.append(f"• {_format_metric('Accounts 1d', item.get('accounts'))}")  # Top Trader Accounts
-        lines.append(f"• {_format_metric('Positions 1d', item.get('positions'))}")  # Top Trader Positions
-        lines.append(f"• {_format_metric('Global 1d', item.get('global'))}")  # Global accounts
+    yield "⭐️ <b>Binance Futures Long/Short (1d)</b>"
+    yield f"<i>Run: {utc_time}</i>"
+
+    for item in sorted(pairs, key=_pair_max_imbalance, reverse=True):
+        yield ""
+        yield f"<u><b>{item['symbol']}</b></u>"
+        yield f"• {_format_ticker(item.get('ticker'))}"
+        yield f"• {_format_metric('Accounts 1d', item.get('accounts'))}"  # Top Trader Accounts
+        yield f"• {_format_metric('Positions 1d', item.get('positions'))}"  # Top Trader Positions
+        yield f"• {_format_metric('Global 1d', item.get('global'))}"  # Global accounts
 
     if errors:
-        lines.append("")
-        lines.append("⚠️ <b>Warnings</b>:")
+        yield ""
+        yield "⚠️ <b>Warnings</b>:"
         for err in errors:
-            lines.append(f"• {err}")
+            yield f"• {err}"
 
-    return "\n".join(lines)
+
+def build_message(run_dt: datetime, pairs: List[Dict[str, object]], errors: List[str] | None = None) -> str:
+    return "\n".join(_iter_lines(run_dt, pairs, errors))
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import Optional
+import os
+import time
+from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .utils import RateLimiter, build_http2_client, json_loads
+
+# One host and a handful of sends per run; keep those connections alive
+POOL_SIZE = 4
+# Telegram allows about one message per second to the same chat
+CHAT_RATE = 1.0
 
 
 class TelegramClient:
@@ -10,6 +20,13 @@ class TelegramClient:
         self.bot_token = bot_token
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
         self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, pool_block=False)
+        self.session.mount("https://", adapter)
+        self._limiter = RateLimiter(CHAT_RATE)
+        # Optional HTTP/2 transport (httpx[http2]); falls back to requests when unavailable
+        self._h2_client = None
+        if os.getenv("TELEGRAM_USE_HTTP2", "").lower() in ("1", "true", "yes"):
+            self._h2_client = build_http2_client(self.session.headers, POOL_SIZE)
 
     def send_message(self, chat_id: str, text: str, parse_mode: str | None = "HTML") -> dict:
         url = f"{self.base_url}/sendMessage"
@@ -20,9 +37,37 @@ class TelegramClient:
         }
         if parse_mode:
             payload["parse_mode"] = parse_mode
-        resp = self.session.post(url, json=payload, timeout=10)
+        resp = self._post(url, payload)
+        if resp.status_code == 429:
+            # Flood control: wait as instructed and retry once
+            time.sleep(self._retry_after(resp))
+            resp = self._post(url, payload)
         resp.raise_for_status()
-        data = resp.json()
+        data = json_loads(resp.content)
         if not data.get("ok"):
             raise ValueError(f"Telegram API error: {data}")
         return data
+
+    def _post(self, url: str, payload: dict):
+        self._limiter.acquire()
+        if self._h2_client is not None:
+            return self._h2_client.post(url, json=payload, timeout=10)
+        return self.session.post(url, json=payload, timeout=10)
+
+    def send_messages(self, chat_id: str, texts: List[str], parse_mode: str | None = "HTML") -> List[dict]:
+        """Send several messages to one chat in order, paced to Telegram's per-chat limit."""
+        return [self.send_message(chat_id, text, parse_mode=parse_mode) for text in texts]
+
+    @staticmethod
+    def _retry_after(resp: requests.Response) -> float:
+        """Seconds to wait from a 429 response (Retry-After header or parameters.retry_after)."""
+        header = resp.headers.get("Retry-After")
+        if header:
+            try:
+                return float(header)
+            except ValueError:
+                pass
+        try:
+            return float(json_loads(resp.content)["parameters"]["retry_after"])
+        except (ValueError, KeyError, TypeError):
+            return 1.0
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Mapping, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def json_loads(content: bytes):
+    """Decode a JSON body from bytes, using orjson when installed."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def build_http2_client(
+    headers: Mapping[str, str], pool_size: int, verify: Union[bool, str] = True, retries: int = 0
+):
+    """Return an ``httpx.Client`` speaking HTTP/2, or None when ``httpx[http2]`` is not installed.
+
+    ``retries`` is passed to the transport, which retries failed connects (httpx has no status retries).
+    """
+    try:
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            retries=max(0, retries),
+        )
+        # Connection-specific headers are illegal in HTTP/2
+        return httpx.Client(
+            headers={k: v for k, v in headers.items() if k.lower() not in ("connection", "keep-alive")},
+            transport=transport,
+        )
+    except ImportError:
+        return None
+
+
+class RateLimiter:
+    """Thread-safe token bucket: ``rate`` requests/second with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Reserve a token even if that goes negative; the deficit is our place in the queue
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)